@@ -36,6 +36,14 @@ class DifferentialDrive:
 
     def calculate_wheelchair_states(self, speed: float, direction: float) -> tuple[models.WheelchairCommand, models.WheelchairCommand]:
         """Calculate the speeds for the left and right wheels."""
+        left_speed, left_direction, right_speed, right_direction = self.calculate_raw(speed, direction)
+        return (
+            models.WheelchairCommand(speed=left_speed, direction=left_direction, timestamp=datetime.datetime.now()),
+            models.WheelchairCommand(speed=right_speed, direction=right_direction, timestamp=datetime.datetime.now() )
+        )
+
+    def calculate_raw(self, speed: float, direction: float) -> tuple[float, float, float, float]:
+        """Same as calculate_wheelchair_states, as plain floats: left speed, left direction, right speed, right direction."""
         # TODO (taillades): make sure that the speed, direction and distance between wheelchairs are in the same unit system
         right_speed = speed + direction / 2
         left_speed = speed - direction / 2
@@ -55,7 +63,6 @@ class DifferentialDrive:
             right_direction = right_direction * self.max_direction / max_direction
             left_direction = left_direction * self.max_direction / max_direction
         
-        return (
-            models.WheelchairCommand(speed=right_speed, direction=right_direction, timestamp=datetime.datetime.now()),
-            models.WheelchairCommand(speed=left_speed, direction=left_direction, timestamp=datetime.datetime.now() )
-        )
\ No newline at end of file
+        # The "right" terms of the formula drive the left wheelchair and vice versa: that is the
+        # mapping the couch has always been driven with, kept on purpose.
+        return right_speed, right_direction, left_speed, left_direction
@@ -1,6 +1,8 @@
 from typing import Literal
 import serial
 
+from libs import serial_latency
+
 
 Side = Literal["left", "right"]
 
@@ -20,6 +22,7 @@ class LightsSerial:
     
     def start(self) -> None:
         self.ser = serial.Serial(self.port, baudrate=self.baudrate, timeout=self.timeout)
+        serial_latency.enable_low_latency(self.ser)
         print(f"Connected to {self.port}")
 
     def set_lights(self, side: Side, state: bool) -> None:
@@ -0,0 +1,101 @@
+"""Non-blocking logging for the real-time loops."""
+
+import collections
+import logging
+import logging.handlers
+import queue
+import time
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+MAX_TRACKED_MESSAGES = 256
+HISTORY_SIZE = 1024
+
+
+class ThrottleFilter(logging.Filter):
+    """Drop records repeating the same message template within *interval* seconds.
+
+    A stuck serial port makes the control loop fail on every tick; this keeps one line per
+    interval instead of fifty per second, even when the arguments (e.g. a counter) change.
+    """
+
+    def __init__(self, interval: float = 5.0) -> None:
+        """
+        Initialize the filter.
+
+        :param interval: Minimum number of seconds between two identical records
+        """
+        super().__init__()
+        self.interval = interval
+        self._last_seen: dict[tuple[str, int, str], float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        last = self._last_seen.get(key)
+        if last is not None and now - last < self.interval:
+            return False
+        if len(self._last_seen) >= MAX_TRACKED_MESSAGES:
+            self._last_seen.clear()
+        self._last_seen[key] = now
+        return True
+
+
+class RingBufferHandler(logging.Handler):
+    """Keep the last *capacity* records in memory so they can be served over HTTP."""
+
+    def __init__(self, capacity: int = HISTORY_SIZE) -> None:
+        """
+        Initialize the handler.
+
+        :param capacity: Number of records kept, the oldest ones are dropped first
+        """
+        super().__init__()
+        self.records: collections.deque[tuple[float, str, str]] = collections.deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.created, record.levelname, record.getMessage()))
+
+    def snapshot(self) -> list[tuple[float, str, str]]:
+        """Return the kept records as ``(unix time, level, message)``, oldest first."""
+        return list(self.records)
+
+
+class QueueLogging:
+    """Hand the records of a logger to a queue drained to stderr by a background thread.
+
+    The calling thread only enqueues, so logging never blocks on the stdio lock. The drain thread
+    also keeps the latest records in ``history``.
+    """
+
+    def __init__(self, logger: logging.Logger, *, throttle: float = 5.0, history: int = HISTORY_SIZE) -> None:
+        """
+        Initialize the queue logging.
+
+        :param logger: Logger whose records are routed through the queue
+        :param throttle: Minimum number of seconds between two identical records
+        :param history: Number of records kept in memory
+        """
+        self.logger = logger
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._handler = logging.handlers.QueueHandler(log_queue)
+        self._handler.addFilter(ThrottleFilter(throttle))
+        stream = logging.StreamHandler()
+        stream.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.history = RingBufferHandler(history)
+        self._listener = logging.handlers.QueueListener(
+            log_queue, stream, self.history, respect_handler_level=True
+        )
+
+    def start(self) -> None:
+        """Attach the queue handler and start the drain thread."""
+        if self.logger.level == logging.NOTSET:
+            self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self._handler)
+        self.logger.propagate = False
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Flush pending records and detach the queue handler."""
+        self._listener.stop()
+        self.logger.removeHandler(self._handler)
+        self.logger.propagate = True
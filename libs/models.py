@@ -2,10 +2,11 @@
 
 import datetime
 
-from pydantic import BaseModel
+import msgspec
+from pydantic import BaseModel, ConfigDict
 
-class JoystickData(BaseModel):
-    """Joystick data model."""
+class JoystickDataMsg(msgspec.Struct, frozen=True, gc=False):
+    """Joystick data model, encoded with msgspec for the hot ``/joystick`` route."""
     speed: float
     direction: float
     x: float
@@ -22,6 +23,9 @@ class JoystickData(BaseModel):
 
 class WheelchairCommand(BaseModel):
     """Request model for wheelchair commands."""
+    # Reject "nan" and "inf", which the serial protocol cannot encode
+    model_config = ConfigDict(allow_inf_nan=False)
+
     speed: float = 0.0
     direction: float = 0.0
     timestamp: datetime.datetime
@@ -0,0 +1,30 @@
+"""Geodesic helpers for the navigation control loop."""
+
+import math
+
+EARTH_RADIUS = 6_371_000.0  # meters
+
+
+def bearing_and_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> tuple[float, float]:
+    """
+    Compute the initial bearing and the great-circle distance from one point to another.
+
+    :param lat1: Latitude of the start point, in degrees
+    :param lon1: Longitude of the start point, in degrees
+    :param lat2: Latitude of the end point, in degrees
+    :param lon2: Longitude of the end point, in degrees
+    :return: Bearing in radians (0 is north, clockwise) and haversine distance in meters
+    """
+    # Evaluate each trigonometric term once, the bearing reuses the haversine ones
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dlam = math.radians(lon2 - lon1)
+    sin_half_dphi = math.sin((phi2 - phi1) * 0.5)
+    sin_half_dlam = math.sin(dlam * 0.5)
+    cos_phi1 = math.cos(phi1)
+    cos_phi2 = math.cos(phi2)
+    a = sin_half_dphi * sin_half_dphi + cos_phi1 * cos_phi2 * sin_half_dlam * sin_half_dlam
+    distance = EARTH_RADIUS * (2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a)))
+    y = math.sin(dlam) * cos_phi2
+    x = cos_phi1 * math.sin(phi2) - math.sin(phi1) * cos_phi2 * math.cos(dlam)
+    return math.atan2(y, x), distance
@@ -0,0 +1,82 @@
+"""Fixed-rate pacing for the control loops."""
+
+import asyncio
+import time
+
+SPIN_MARGIN = 0.0015  # seconds, timer wake-ups are routinely late by about a millisecond
+BACKOFF_MAX = 0.5  # seconds, longest pause between retries of a failing tick
+BACKOFF_MAX_FAILURES = 8  # consecutive failures counted, enough to reach BACKOFF_MAX from a 20 ms period
+
+
+def backoff_delay(period: float, failures: int) -> float:
+    """
+    Pause before retrying a tick that failed *failures* times in a row.
+
+    The first retry waits one period, each further failure doubles the pause, up to BACKOFF_MAX:
+    a persistent fault, such as an unplugged port or an unreachable controller, is retried less
+    and less often instead of on every tick.
+
+    :param period: Loop period in seconds
+    :param failures: Consecutive failures, at least 1
+    :return: Pause in seconds
+    """
+    return min(period * 2 ** (min(failures, BACKOFF_MAX_FAILURES) - 1), BACKOFF_MAX)
+
+
+class DeadlineTicker:
+    """Pace an asyncio loop at a fixed period against absolute deadlines.
+
+    Each deadline is the previous one plus the period, so work and wake-up delays never add up
+    to drift. The loop is woken by a timer armed at an absolute time on the event loop's clock,
+    just before the deadline, and busy-waits the rest of the way, which removes the scheduler
+    wake-up jitter from the period. When a tick ends more than a whole period late the missed
+    ticks are dropped instead of being run back-to-back to catch up.
+    """
+
+    def __init__(self, period: float, *, spin: float = SPIN_MARGIN) -> None:
+        """
+        Initialize the ticker.
+
+        :param period: Loop period in seconds
+        :param spin: Time before each deadline spent busy-waiting instead of sleeping, 0 to only sleep
+        """
+        self.period = period
+        self.spin = spin
+        self.dropped = 0
+        self._deadline: float | None = None
+        self._wake: asyncio.Event | None = None
+
+    def reset(self) -> None:
+        """Restart the schedule from the next call to wait, e.g. after pausing the loop on purpose."""
+        self._deadline = None
+
+    async def wait(self) -> bool:
+        """
+        Wait for the next deadline.
+
+        :return: True when the loop overran and ticks were dropped
+        """
+        # time.monotonic is the clock behind loop.time(), on uvloop too: deadlines can go to call_at
+        clock = time.monotonic
+        now = clock()
+        deadline = (now if self._deadline is None else self._deadline) + self.period
+        if now > deadline + self.period:
+            # More than a whole tick late: restart the schedule from now, but still yield to the loop
+            self.dropped += 1
+            self._deadline = now
+            await asyncio.sleep(0)
+            return True
+        self._deadline = deadline
+        if deadline - now > self.spin:
+            if self._wake is None:
+                self._wake = asyncio.Event()
+            wake = self._wake
+            wake.clear()
+            timer = asyncio.get_running_loop().call_at(deadline - self.spin, wake.set)
+            try:
+                await wake.wait()
+            finally:
+                timer.cancel()
+        while clock() < deadline:
+            pass
+        return False
@@ -0,0 +1,141 @@
+"""Run latency-sensitive loops away from the HTTP event loop."""
+
+import asyncio
+import os
+import threading
+from contextlib import suppress
+from typing import Awaitable, Callable
+
+
+def make_realtime(*, priority: int, cpu: int | None) -> None:
+    """
+    Pin the calling thread to *cpu* and schedule it with ``SCHED_FIFO`` at *priority*.
+
+    Needs Linux and ``CAP_SYS_NICE``. Failures are reported and ignored so the caller keeps
+    running under the default scheduler.
+
+    :param priority: SCHED_FIFO priority (1-99), 0 leaves the scheduling policy untouched
+    :param cpu: CPU to pin the thread to (ideally one reserved with ``isolcpus=``), None to not pin
+    """
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except (AttributeError, OSError, ValueError) as exc:
+            print(f"Unable to pin thread to CPU {cpu}: {exc}")
+    if priority > 0:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except (AttributeError, OSError, ValueError) as exc:
+            print(f"Unable to set SCHED_FIFO priority {priority}: {exc}")
+
+
+def current_cpus() -> set[int] | None:
+    """Return the CPUs the calling thread may run on, None where Python cannot tell."""
+    try:
+        return os.sched_getaffinity(0)
+    except (AttributeError, OSError):
+        return None
+
+
+def make_default(*, cpus: set[int] | None) -> None:
+    """
+    Put the calling thread back under the default ``SCHED_OTHER`` scheduler, on *cpus*.
+
+    A thread inherits the scheduling policy and CPU affinity of the thread that starts it: helper
+    threads that may be started from a real-time thread call this first. Failures are reported
+    and ignored, so it is safe as a thread pool initializer.
+
+    :param cpus: CPUs the thread may run on, e.g. from :func:`current_cpus`, None to not change them
+    """
+    if cpus is not None:
+        try:
+            os.sched_setaffinity(0, cpus)
+        except (AttributeError, OSError, ValueError) as exc:
+            print(f"Unable to pin thread to CPUs {sorted(cpus)}: {exc}")
+    try:
+        if os.sched_getscheduler(0) != os.SCHED_OTHER:
+            os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+    except (AttributeError, OSError, ValueError) as exc:
+        print(f"Unable to restore the default scheduler: {exc}")
+
+
+class LoopThread:
+    """Run a coroutine on its own asyncio event loop inside a dedicated daemon thread.
+
+    A fixed-rate control loop run this way is not queued behind the HTTP handlers of the server's
+    event loop, so a slow handler cannot delay a tick.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[], Awaitable[None]],
+        *,
+        name: str,
+        priority: int = 0,
+        cpu: int | None = None,
+        loop_factory: Callable[[], asyncio.AbstractEventLoop] = asyncio.new_event_loop,
+    ) -> None:
+        """
+        Initialize the loop thread.
+
+        :param target: Coroutine function to run until it returns or is cancelled
+        :param name: Name given to the thread
+        :param priority: SCHED_FIFO priority of the thread, 0 to keep the default scheduler
+        :param cpu: CPU to pin the thread to, None to let the kernel choose
+        :param loop_factory: Creates the thread's event loop, e.g. ``uvloop.new_event_loop``
+        """
+        self._target = target
+        self._name = name
+        self._priority = priority
+        self._cpu = cpu
+        self._loop_factory = loop_factory
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._ready = threading.Event()
+        self._startup_error: BaseException | None = None
+
+    def start(self) -> None:
+        """Spawn the thread and return once its event loop owns the task.
+
+        :raises Exception: Whatever prevented the thread from setting up its event loop and task
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._ready.clear()
+        self._startup_error = None
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Cancel the task from any thread and wait for the loop to wind down."""
+        if self._loop and self._task:
+            with suppress(RuntimeError):  # loop already closed
+                self._loop.call_soon_threadsafe(self._task.cancel)
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        """Thread body: create a private loop and drive the task to completion."""
+        # start() waits on _ready: set it whatever happens, with the error if the setup failed
+        try:
+            make_realtime(priority=self._priority, cpu=self._cpu)
+            loop = self._loop_factory()
+            asyncio.set_event_loop(loop)
+            self._loop = loop
+            self._task = loop.create_task(self._target())
+        except BaseException as exc:
+            # Reported by start(), in the thread that can act on it
+            self._startup_error = exc
+            return
+        finally:
+            self._ready.set()
+        try:
+            with suppress(asyncio.CancelledError):
+                loop.run_until_complete(self._task)
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
@@ -7,7 +7,7 @@ import threading
 import serial
 import datetime
 
-from libs import normalization, models
+from libs import normalization, models, serial_latency
 
 MAX_SPEED: Final[int] = 255
 BAUD_RATE: Final[int] = 38400
@@ -110,14 +110,16 @@ def serial_communication_loop(ser: serial.Serial, wheelchair_state: models.Wheel
 class WheelchairController:
     """Main controller class for wheelchair operations."""
     
-    def __init__(self, port: str = "/dev/ttyUSB0") -> None:
+    def __init__(self, port: str = "/dev/ttyUSB0", low_latency: bool = False) -> None:
         """
         Initialize the wheelchair controller.
         
         :param port: Serial port to connect to
+        :param low_latency: Tune the serial adapter for low latency every time the port is opened
         :param max_idle_time: Maximum idle time in seconds before the controller resets the state to idle.
         """
         self.port = port
+        self.low_latency = low_latency
         self.serial_connection: serial.Serial | None = None
         self.serial_thread: threading.Thread | None = None
         self.stop_event = threading.Event()
@@ -147,6 +149,8 @@ class WheelchairController:
                 timeout=0.2,
             )
             print(f"[{self.port}] Serial connection established")
+            if self.low_latency:
+                serial_latency.enable_low_latency(self.serial_connection)
 
             time.sleep(START_WAIT_TIME)
 
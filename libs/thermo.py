@@ -1,5 +1,7 @@
 import serial
 
+from libs import serial_latency
+
 class ThermoSerial:
     """
     Interface for reading temperature data from the Arduino-based
@@ -24,6 +26,7 @@ class ThermoSerial:
     
     def start(self) -> None:
         self.ser = serial.Serial(self.port, baudrate=self.baudrate, timeout=self.timeout)
+        serial_latency.enable_low_latency(self.ser)
         print(f"Connected to {self.port}")
 
     def read_temperatures(self) -> dict[str, float] | None:
@@ -1,7 +1,7 @@
 import threading
 import time
 import importlib
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, NamedTuple
 
 import inputs
 
@@ -14,6 +14,22 @@ def play_music_callback(music_file: str) -> None:
     thread = threading.Thread(target=music_thread, daemon=True)
     thread.start()
 
+class JoystickSnapshot(NamedTuple):
+    """Joystick and button states read in one go, in the field order of :class:`libs.models.JoystickDataMsg`."""
+    speed: float
+    direction: float
+    x: float
+    y: float
+    button_a: bool
+    button_b: bool
+    button_x: bool
+    button_y: bool
+    button_up: bool
+    button_down: bool
+    button_left: bool
+    button_right: bool
+    button_start: bool
+
 class XboxRemote:
     """Xbox remote input handler for reading joystick and button states."""
     
@@ -178,6 +194,29 @@ class XboxRemote:
         direction = self.left_x
         return speed, direction
         
+    def snapshot(self) -> JoystickSnapshot:
+        """
+        Get the joystick and main button states at once.
+        
+        Returns:
+            JoystickSnapshot: speed and direction as in get_joystick_speed_direction, raw x and y, then buttons
+        """
+        return JoystickSnapshot(
+            -self.left_y,
+            self.left_x,
+            self.left_x,
+            self.left_y,
+            self.button_a,
+            self.button_b,
+            self.button_x,
+            self.button_y,
+            self.button_up,
+            self.button_down,
+            self.button_left,
+            self.button_right,
+            self.button_start,
+        )
+        
     def add_button_callback(self, button: str, callback: Callable) -> None:
         """
         Add a callback function for button events.
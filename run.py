@@ -47,6 +47,16 @@ def run_controller(
         envvar="CONTROLLER_DEADZONE",
         help="Joystick deadzone value (from CONTROLLER_DEADZONE env var if not provided)",
     ),
+    rt_priority: int = typer.Option(
+        '50',
+        envvar="CONTROLLER_RT_PRIORITY",
+        help="SCHED_FIFO priority of the control loop thread, 0 to disable (from CONTROLLER_RT_PRIORITY env var if not provided)",
+    ),
+    rt_cpu: int = typer.Option(
+        None,
+        envvar="CONTROLLER_RT_CPU",
+        help="CPU to pin the control loop thread to (from CONTROLLER_RT_CPU env var if not provided)",
+    ),
 ) -> None:
     """Run the unified Couch server handling joystick, controller and wheelchairs."""
 
@@ -62,6 +72,8 @@ def run_controller(
         right_serial_port=right_serial_port,
         lights_serial_port=lights_serial_port,
         deadzone=deadzone,
+        rt_priority=rt_priority,
+        rt_cpu=rt_cpu,
     )
     
 
@@ -97,6 +109,21 @@ def run_navigation(
         envvar="NAVIGATION_GPS_SERIAL_PORT",
         help="Serial port for the GPS (from NAVIGATION_GPS_SERIAL_PORT env var if not provided)",
     ),
+    reverse_proxy: bool = typer.Option(
+        False,
+        envvar="NAVIGATION_REVERSE_PROXY",
+        help="Let a reverse proxy serve the pages and static assets (from NAVIGATION_REVERSE_PROXY env var if not provided)",
+    ),
+    rt_priority: int = typer.Option(
+        '40',
+        envvar="NAVIGATION_RT_PRIORITY",
+        help="SCHED_FIFO priority of the control loop thread, 0 to disable (from NAVIGATION_RT_PRIORITY env var if not provided)",
+    ),
+    rt_cpu: int = typer.Option(
+        None,
+        envvar="NAVIGATION_RT_CPU",
+        help="CPU to pin the control loop thread to (from NAVIGATION_RT_CPU env var if not provided)",
+    ),
 ) -> None:
     """Run the navigation server."""
     if not controller_host:
@@ -111,6 +138,9 @@ def run_navigation(
         controller_port=controller_port,
         thermo_serial_port=thermo_serial_port,
         gps_serial_port=gps_serial_port,
+        reverse_proxy=reverse_proxy,
+        rt_priority=rt_priority,
+        rt_cpu=rt_cpu,
     )
 
 if __name__ == "__main__":
@@ -1,15 +1,95 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager, suppress
-import datetime
-from typing import Any, AsyncGenerator, Dict
+import functools
+import logging
+import math
+from typing import Any, AsyncGenerator, Callable, Dict
 import os
+import sys
+import threading
+import time
 import asyncio
 
+import anyio.to_thread
+import msgspec
+import orjson
+import serial
 import uvicorn
-from fastapi import FastAPI, HTTPException
+import uvloop
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter, ValidationError
+
+from libs import differential, lights, logs, models, pacing, realtime, shark, xbox
+
+logger = logging.getLogger(__name__)
+
+CONTROL_LOOP_PERIOD = 0.02  # seconds, 50 Hz
+TELEMETRY_STREAM_PERIOD = 0.05  # seconds, 20 Hz
+COMMAND_EPSILON = 1e-3  # speed/direction changes smaller than this are not worth a new command
+COMMAND_HEARTBEAT = 0.5  # seconds, an unchanged command is still re-sent this often
+GIL_SWITCH_INTERVAL = 0.001  # seconds, CPython defaults to 5 ms
+WHEELCHAIR_SNAPSHOT_TTL = 0.2  # seconds
+CONTROL_FAST_OK = b'{"ok":true}'
+CONTROLLER_CONTROL_OK = b'{"message":"Couch command received"}'
+DEFAULT_THREAD_LIMIT = 8  # anyio defaults to 40 worker threads
+
+_command_adapter = TypeAdapter(models.WheelchairCommand)
+
+def _make_deadzone(deadzone: float) -> Callable[[float], float]:
+    """Build a function returning 0 for values inside the deadzone, with both bounds bound once."""
+    low = -deadzone
+
+    def apply_deadzone(value: float) -> float:
+        return value if value >= deadzone or value <= low else 0.0
+
+    return apply_deadzone
+
+async def _read_command(request: Request) -> models.WheelchairCommand:
+    """Validate the raw JSON body as a command, bypassing FastAPI's body parameter resolution."""
+    try:
+        return _command_adapter.validate_json(await request.body())
+    except ValidationError as exc:
+        # Keep the 422 response FastAPI gives for an invalid body parameter: locations under "body", no doc URLs
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        raise RequestValidationError(errors) from exc
+
+def _differs(sent: tuple[float, float, float], speed: float, direction: float, now: float) -> bool:
+    """Tell whether *speed* and *direction* are worth sending given the last ``(speed, direction, time)`` *sent*."""
+    sent_speed, sent_direction, stamp = sent
+    return (
+        now - stamp >= COMMAND_HEARTBEAT
+        or abs(speed - sent_speed) >= COMMAND_EPSILON
+        or abs(direction - sent_direction) >= COMMAND_EPSILON
+    )
+
+def _log_failed_command(future: Future[None]) -> None:
+    """Report a wheelchair command that raised, since nobody awaits the control loop's futures."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Wheelchair command failed", exc_info=future.exception())
+
+async def _stream(websocket: WebSocket, payload: Callable[[], str], period: float) -> None:
+    """Send ``payload()`` every *period* seconds until the client disconnects."""
+    async def push() -> None:
+        with suppress(WebSocketDisconnect, OSError):
+            while True:
+                await websocket.send_text(payload())
+                await asyncio.sleep(period)
+
+    await websocket.accept()
+    pusher = asyncio.create_task(push())
+    try:
+        # Clients never talk back: receiving only returns once they go away.
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        pusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await pusher
 
-from libs import differential, lights, models, shark, xbox
 
 class ControllerServer:
     """Unified server that embeds joystick reading, differential control and direct wheelchair commands."""
@@ -21,15 +101,20 @@ class ControllerServer:
         right_serial_port: str,
         lights_serial_port: str,
         deadzone: float,
+        rt_priority: int = 0,
+        rt_cpu: int | None = None,
     ) -> None:
         """Build the unified server.
 
         :param left_serial_port: Serial port for the left wheelchair controller
         :param right_serial_port: Serial port for the right wheelchair controller
         :param deadzone: Ignore absolute joystick values below this threshold
+        :param rt_priority: SCHED_FIFO priority of the control thread, 0 to keep the default scheduler
+        :param rt_cpu: CPU the control thread is pinned to, None to let the kernel choose
         """
-        self.left_service = shark.WheelchairController(port=left_serial_port)
-        self.right_service = shark.WheelchairController(port=right_serial_port)
+        # Without low latency mode the FTDI adapters hold bytes for up to 16 ms, most of a tick
+        self.left_service = shark.WheelchairController(port=left_serial_port, low_latency=True)
+        self.right_service = shark.WheelchairController(port=right_serial_port, low_latency=True)
         self.lights_service = lights.LightsSerial(port=lights_serial_port)
         self.remote_service = xbox.XboxRemote(
             callbacks={
@@ -43,24 +128,84 @@ class ControllerServer:
         )
         
         self.differential_drive = differential.DifferentialDrive()
-        self.navigation_command = models.WheelchairCommand(speed=0.0, direction=0.0, timestamp=datetime.datetime.now())
-        self.allow_navigation = True
+        # (allow navigation, navigation speed, navigation direction), swapped in as a whole so the
+        # control thread reads a consistent triple without locking. The writers (HTTP loop and
+        # remote thread) still serialise among themselves so a B press is never overwritten.
+        self._nav_state: tuple[bool, float, float] = (True, 0.0, 0.0)
+        self._nav_write_lock = threading.Lock()
+        # control() only blocks while lazily reconnecting a port; keep that off the calling loops.
+        # One worker per port: a side stuck reconnecting never delays the other one's commands.
+        # The workers start in the first thread to submit, usually the real-time control thread:
+        # put them back on the default scheduler and CPUs (along with the shark threads they restart).
+        default_scheduling = functools.partial(realtime.make_default, cpus=realtime.current_cpus())
+        self._left_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="wheelchair-left", initializer=default_scheduling
+        )
+        self._right_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="wheelchair-right", initializer=default_scheduling
+        )
+        # Taken by both the control thread and the HTTP loop around the pending/sent bookkeeping below.
+        # It is only ever held for an executor submit, never for serial I/O.
+        self._drive_lock = threading.Lock()
+        self._left_pending: Future[None] | None = None
+        self._right_pending: Future[None] | None = None
+        # (speed, direction, monotonic time) of the last command submitted to each side
+        self._left_sent = (0.0, 0.0, -math.inf)
+        self._right_sent = (0.0, 0.0, -math.inf)
         
         self.deadzone = deadzone
+        self._apply_deadzone = _make_deadzone(deadzone)
+        self._joy_enc = msgspec.json.Encoder()
+
+        # Snapshots served by the routes: the joystick one is refreshed by the control loop at every
+        # tick, the wheelchair ones on demand by the HTTP loop once they are older than the TTL.
+        # Each has a single writer and is swapped in with one assignment, so handlers read them
+        # without locking.
+        self._joystick_snapshot = self._read_joystick()
+        self._joystick_body = (self._joystick_snapshot, self._joy_enc.encode(self._joystick_snapshot))
+        self._wheelchair_snapshots = (
+            time.monotonic(),
+            self._read_wheelchair(self.left_service),
+            self._read_wheelchair(self.right_service),
+        )
+        self._telemetry_body: tuple[tuple[Any, ...], bytes] = ((None, None, None), b"")
         
-        self.app = FastAPI(title="Couch Unified Server", version="1.0.0", lifespan=self._lifespan)
+        # Known clients only: skip the OpenAPI/docs machinery and serialise responses with orjson
+        self.app = FastAPI(
+            title="Couch Unified Server",
+            version="1.0.0",
+            lifespan=self._lifespan,
+            docs_url=None,
+            redoc_url=None,
+            openapi_url=None,
+            default_response_class=ORJSONResponse,
+        )
+        self._logging = logs.QueueLogging(logger)
         self._setup_routes()
 
-        self._task_loop: asyncio.Task | None = None
+        self._control_thread = realtime.LoopThread(
+            self._control_loop,
+            name="couch-control",
+            priority=rt_priority,
+            cpu=rt_cpu,
+            loop_factory=uvloop.new_event_loop,
+        )
 
     # ----------------------------- lifespan -----------------------------
 
+    @property
+    def allow_navigation(self) -> bool:
+        """Whether the navigation commands drive the couch while the joystick is idle."""
+        return self._nav_state[0]
+
     def _set_allow_navigation(self, allow: bool) -> None:
         """Set the allow navigation flag."""
-        self.allow_navigation = allow
-        if not allow:
-            # Reset the navigation so your dont' have a ghost command sitting around
-            self.navigation_command = models.WheelchairCommand(speed=0.0, direction=0.0, timestamp=datetime.datetime.now())
+        with self._nav_write_lock:
+            if allow:
+                self._nav_state = (True, *self._nav_state[1:])
+            else:
+                # Reset the navigation so your dont' have a ghost command sitting around
+                self._nav_state = (False, 0.0, 0.0)
 
     @asynccontextmanager
     async def _lifespan(self, _app: FastAPI) -> AsyncGenerator[None, Any]:
@@ -70,58 +215,170 @@ class ControllerServer:
         On startup, start the Xbox remote listener and both wheelchair controllers.
         On shutdown, stop all hardware services to free the serial ports.
         """
+        self._logging.start()
+        # Bound the threads anyio may spawn for sync work (file responses, sync dependencies) on this small board
+        anyio.to_thread.current_default_thread_limiter().total_tokens = DEFAULT_THREAD_LIMIT
         self.remote_service.start()
         self.left_service.start()
         self.right_service.start()
-        self._task_loop = asyncio.create_task(self._control_loop())
+        self._control_thread.start()
         try:
             yield
         finally:
-            if self._task_loop:
-                self._task_loop.cancel()
-                with suppress(asyncio.CancelledError):
-                    await self._task_loop
+            self._control_thread.stop()
             self.remote_service.stop()
             self.left_service.stop()
             self.right_service.stop()
+            self._logging.stop()
 
     async def _control_loop(self) -> None:
         """Background loop reading joystick and driving the wheelchairs."""
+        ticker = pacing.DeadlineTicker(CONTROL_LOOP_PERIOD)
+        failures = 0
         while True:
             try:
-                start = asyncio.get_running_loop().time()
-                speed, direction = self._get_speed_direction_from_controller()
-                if speed == 0.0 and direction == 0.0 and self.allow_navigation:
-                    speed = self.navigation_command.speed
-                    direction = self.navigation_command.direction
-                left_cmd, right_cmd = self.differential_drive.calculate_wheelchair_states(speed, direction)
-                self.left_service.control(left_cmd.speed, left_cmd.direction)
-                self.right_service.control(right_cmd.speed, right_cmd.direction)
-                elapsed = asyncio.get_running_loop().time() - start
-                await asyncio.sleep(max(0.0, 0.02 - elapsed))
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:
-                print(f"Controller control-loop error: {exc}")
-                await asyncio.sleep(0.02)
+                self._iter()
+            except (serial.SerialException, OSError) as exc:
+                failures += 1
+                logger.warning("Controller control-loop tick failed (%d in a row): %s", failures, exc)
+            except Exception:
+                # Unexpected bug: log it but keep ticking, a dead loop would leave the last command latched
+                failures += 1
+                logger.exception("Controller control-loop tick failed (%d in a row)", failures)
+            else:
+                failures = 0
+            if failures:
+                await asyncio.sleep(pacing.backoff_delay(CONTROL_LOOP_PERIOD, failures))
+                ticker.reset()
+                continue
+            if await ticker.wait():
+                logger.warning("Controller control loop overran, %d ticks dropped so far", ticker.dropped)
+
+    def _iter(self) -> None:
+        """Run one control tick: sample the joystick and submit the resulting wheelchair commands."""
+        joystick = self._read_joystick()
+        if joystick != self._joystick_snapshot:
+            # Only swap on change so the encoded /joystick body stays valid while idle
+            self._joystick_snapshot = joystick
+        speed, direction = self._get_speed_direction_from_controller(joystick)
+        if speed == 0.0 and direction == 0.0:
+            allow, nav_speed, nav_direction = self._nav_state
+            if allow:
+                speed, direction = nav_speed, nav_direction
+        # Plain floats: no command models to build on every tick
+        left_speed, left_direction, right_speed, right_direction = self.differential_drive.calculate_raw(speed, direction)
+        self._drive(left_speed, left_direction, right_speed, right_direction, skip_unchanged=True)
 
     # ----------------------------- internal helpers -----------------------------
 
-    def _apply_deadzone(self, value: float) -> float:
-        """Return 0 if *value* lies inside the deadzone."""
-        return 0.0 if abs(value) < self.deadzone else value
-    
-    def _get_speed_direction_from_controller(self) -> tuple[float, float]:
-        """Get the speed and direction from the joystick."""
-        speed, direction = self.remote_service.get_joystick_speed_direction()
-        speed = self._apply_deadzone(speed)
-        direction = self._apply_deadzone(direction)
-        return speed, direction
+    def _drive(
+        self,
+        left_speed: float,
+        left_direction: float,
+        right_speed: float,
+        right_direction: float,
+        *,
+        skip_unchanged: bool = False,
+    ) -> tuple[Future[None], Future[None]]:
+        """Hand both wheelchair commands to their serial executors back-to-back, without waiting.
+
+        A side still busy with its previous command (i.e. reconnecting) drops this one: the
+        next tick carries a fresher command anyway. Await the returned futures to know when
+        both commands were applied.
+
+        :param skip_unchanged: Leave out a side whose command is within COMMAND_EPSILON of the last
+            one it was sent, unless that was more than COMMAND_HEARTBEAT ago. Each side is checked
+            on its own, so a pivot only re-sends the side that changed.
+        """
+        with self._drive_lock:
+            now = time.monotonic()
+            if not skip_unchanged or _differs(self._left_sent, left_speed, left_direction, now):
+                pending = self._left_pending
+                self._left_pending = self._submit(pending, self._left_executor, self.left_service, left_speed, left_direction)
+                if self._left_pending is not pending:
+                    self._left_sent = (left_speed, left_direction, now)
+            if not skip_unchanged or _differs(self._right_sent, right_speed, right_direction, now):
+                pending = self._right_pending
+                self._right_pending = self._submit(pending, self._right_executor, self.right_service, right_speed, right_direction)
+                if self._right_pending is not pending:
+                    self._right_sent = (right_speed, right_direction, now)
+            return self._left_pending, self._right_pending
+
+    def _drive_side(self, side: lights.Side, speed: float, direction: float) -> Future[None]:
+        """Hand a command to a single wheelchair's serial executor, e.g. from its manual control route.
+
+        Unlike :meth:`_drive`, the command is queued behind a pending one rather than dropped. It is
+        recorded as the side's last sent command, so the control loop's next tick replaces it as
+        soon as the loop's own command for that side differs.
+        """
+        with self._drive_lock:
+            now = time.monotonic()
+            if side == "left":
+                future = self._submit(None, self._left_executor, self.left_service, speed, direction)
+                self._left_pending = future
+                self._left_sent = (speed, direction, now)
+            else:
+                future = self._submit(None, self._right_executor, self.right_service, speed, direction)
+                self._right_pending = future
+                self._right_sent = (speed, direction, now)
+            return future
+
+    @staticmethod
+    def _submit(
+        pending: Future[None] | None,
+        executor: ThreadPoolExecutor,
+        service: shark.WheelchairController,
+        speed: float,
+        direction: float,
+    ) -> Future[None]:
+        """Submit ``service.control`` to *executor* unless *pending* is still running."""
+        if pending is not None and not pending.done():
+            return pending
+        future = executor.submit(service.control, speed, direction)
+        future.add_done_callback(_log_failed_command)
+        return future
+
+    def _get_speed_direction_from_controller(self, joystick: models.JoystickDataMsg) -> tuple[float, float]:
+        """Get the speed and direction from a joystick snapshot."""
+        apply_deadzone = self._apply_deadzone
+        return apply_deadzone(joystick.speed), apply_deadzone(joystick.direction)
+
+    def _read_joystick(self) -> models.JoystickDataMsg:
+        """Read the current joystick state."""
+        return models.JoystickDataMsg(*self.remote_service.snapshot())
+
+    def _read_wheelchairs(self) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return the left and right wheelchair snapshots, re-reading both once they are older than the TTL.
+
+        Only the HTTP loop calls this, so a dashboard polling several routes shares one read.
+        """
+        stamp, left, right = self._wheelchair_snapshots
+        now = time.monotonic()
+        if now - stamp > WHEELCHAIR_SNAPSHOT_TTL:
+            left = self._read_wheelchair(self.left_service)
+            right = self._read_wheelchair(self.right_service)
+            self._wheelchair_snapshots = (now, left, right)
+        return left, right
+
+    @staticmethod
+    def _read_wheelchair(service: shark.WheelchairController) -> Dict[str, Any]:
+        """Read the status and SPM information of a wheelchair in one go."""
+        spm = service.get_spm_general_information()
+        return {
+            'status': service.get_status(),
+            'fuel_gauge': spm['fuel_gauge'],
+            'ground_speed': spm['ground_speed'],
+        }
 
     # ----------------------------- routes -----------------------------
 
     def _setup_routes(self) -> None:
         app = self.app
+        # These never change after construction: bind them once so handlers read a closure cell
+        # instead of looking them up on ``self`` for every request.
+        encode_joystick = self._joy_enc.encode
+        log_history = self._logging.history
+        calculate_raw = self.differential_drive.calculate_raw
 
         @app.get("/")
         async def root() -> Dict[str, str]:  # noqa: D401
@@ -130,27 +387,35 @@ class ControllerServer:
         @app.get("/health")
         async def health() -> Dict[str, str]:  # noqa: D401
             return {"status": "healthy"}
+
+        @app.get("/logs")
+        async def get_logs() -> Dict[str, Any]:  # noqa: D401
+            """Get the latest controller log records as [unix time, level, message], oldest first."""
+            return {"logs": log_history.snapshot()}
         
         @app.get("/navigation/allow")
         async def get_allow_navigation() -> Dict[str, bool]:  # noqa: D401
             return {"allow": self.allow_navigation}
         
         @app.post("/navigation/command")
-        async def set_navigation_command(cmd: models.WheelchairCommand) -> Dict[str, Any]:  # noqa: D401
-            self.navigation_command = models.WheelchairCommand(
-                speed=cmd.speed,
-                direction=cmd.direction,
-                timestamp=datetime.datetime.now(),
-            )
+        async def set_navigation_command(request: Request) -> Dict[str, Any]:  # noqa: D401
+            cmd = await _read_command(request)
+            with self._nav_write_lock:
+                self._nav_state = (self._nav_state[0], cmd.speed, cmd.direction)
             return {"message": "Navigation command received"}
 
         @app.post("/controller/control")
-        async def controller_control(cmd: models.WheelchairCommand) -> Dict[str, Any]:  # noqa: D401
+        async def controller_control(request: Request, debug: bool = False) -> Response:  # noqa: D401
+            """Drive both wheelchairs, replying with the solved per-side commands only with ``?debug=1``."""
+            cmd = await _read_command(request)
             try:
+                if not debug:
+                    await asyncio.gather(*map(asyncio.wrap_future, self._drive(*calculate_raw(cmd.speed, cmd.direction))))
+                    return Response(CONTROLLER_CONTROL_OK, media_type="application/json")
                 left_cmd, right_cmd = self.differential_drive.calculate_wheelchair_states(cmd.speed, cmd.direction)
-                self.left_service.control(left_cmd.speed, left_cmd.direction)
-                self.right_service.control(right_cmd.speed, right_cmd.direction)
-                return {
+                futures = self._drive(left_cmd.speed, left_cmd.direction, right_cmd.speed, right_cmd.direction)
+                await asyncio.gather(*map(asyncio.wrap_future, futures))
+                return ORJSONResponse({
                     "message": "Couch command received",
                     "speed": cmd.speed,
                     "left_direction": left_cmd.direction,
@@ -159,86 +424,152 @@ class ControllerServer:
                     "right_speed": right_cmd.speed,
                     "left_timestamp": left_cmd.timestamp,
                     "right_timestamp": right_cmd.timestamp,
-                }
+                })
             except Exception as exc:
                 raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+        @app.post("/controller/control_fast")
+        async def controller_control_fast(request: Request) -> Response:  # noqa: D401
+            """Drive both wheelchairs from a ``{"speed": ..., "direction": ...}`` body, for the 50 Hz navigation stream.
+
+            No model validation and no waiting on the serial executors: failures are logged by the
+            executors and the next command supersedes this one within a tick anyway.
+            """
+            try:
+                data = orjson.loads(await request.body())
+                speed = float(data["speed"])
+                direction = float(data["direction"])
+            except (KeyError, TypeError, ValueError) as exc:
+                raise HTTPException(status_code=422, detail=f"Invalid command: {exc!r}") from exc
+            # float() takes "nan" and "inf": a NaN would kill the shark TX thread and never compare as changed
+            if not (math.isfinite(speed) and math.isfinite(direction)):
+                raise HTTPException(status_code=422, detail="Invalid command: speed and direction must be finite")
+            self._drive(*calculate_raw(speed, direction))
+            return Response(CONTROL_FAST_OK, media_type="application/json")
         
         @app.get("/fuel_gauge")
         async def fuel_gauge() -> Dict[str, Any]:  # noqa: D401
+            left, right = self._read_wheelchairs()
             return {
-                'left': self.left_service.get_spm_general_information()['fuel_gauge'],
-                'right': self.right_service.get_spm_general_information()['fuel_gauge'],
+                'left': left['fuel_gauge'],
+                'right': right['fuel_gauge'],
             }
         
         @app.get("/ground_speed")
         async def ground_speed() -> Dict[str, Any]:  # noqa: D401
+            left, right = self._read_wheelchairs()
             return {
-                'left': self.left_service.get_spm_general_information()['ground_speed'],
-                'right': self.right_service.get_spm_general_information()['ground_speed'],
+                'left': left['ground_speed'],
+                'right': right['ground_speed'],
             }
         
-        @app.get("/joystick", response_model=models.JoystickData)
-        async def get_joystick() -> models.JoystickData:  # noqa: D401
+        @app.get("/telemetry")
+        async def telemetry() -> Dict[str, Any]:  # noqa: D401
+            """Get the fuel gauge and ground speed of both wheelchairs in one request."""
+            left, right = self._read_wheelchairs()
+            return {
+                'left': {'fuel_gauge': left['fuel_gauge'], 'ground_speed': left['ground_speed']},
+                'right': {'fuel_gauge': right['fuel_gauge'], 'ground_speed': right['ground_speed']},
+            }
+
+        def joystick_payload() -> bytes:
+            """Return the JSON body of the latest joystick snapshot, encoding it only once per change."""
+            snapshot = self._joystick_snapshot
+            encoded_snapshot, body = self._joystick_body
+            if encoded_snapshot is not snapshot:
+                body = encode_joystick(snapshot)
+                self._joystick_body = (snapshot, body)
+            return body
+
+        @app.get("/joystick")
+        async def get_joystick() -> Response:  # noqa: D401
             """Get the current joystick state."""
-            speed, direction = self.remote_service.get_joystick_speed_direction()
-            x, y = self.remote_service.get_joystick_xy()
-            return models.JoystickData(
-                speed=speed,
-                direction=direction,
-                x=x,
-                y=y,
-                button_a=self.remote_service.button_a,
-                button_b=self.remote_service.button_b,
-                button_x=self.remote_service.button_x,
-                button_y=self.remote_service.button_y,
-                button_up=self.remote_service.button_up,
-                button_down=self.remote_service.button_down,
-                button_left=self.remote_service.button_left,
-                button_right=self.remote_service.button_right,
-                button_start=self.remote_service.button_start,
-            )
+            return Response(joystick_payload(), media_type="application/json")
+
+        def telemetry_payload() -> bytes:
+            """Return the JSON body of the combined joystick and wheelchair snapshots, encoded once per change."""
+            key = (self._joystick_snapshot, *self._read_wheelchairs())
+            encoded_key, body = self._telemetry_body
+            if any(old is not new for old, new in zip(encoded_key, key)):
+                joystick, left, right = key
+                body = encode_joystick({'joystick': joystick, 'left': left, 'right': right})
+                self._telemetry_body = (key, body)
+            return body
+
+        @app.websocket("/telemetry/ws")
+        async def telemetry_stream(websocket: WebSocket) -> None:  # noqa: D401
+            """Push the joystick state and both wheelchair snapshots every TELEMETRY_STREAM_PERIOD."""
+            await _stream(websocket, lambda: telemetry_payload().decode(), TELEMETRY_STREAM_PERIOD)
 
         @app.post("/wheelchair/left/control")
-        async def left_control(cmd: models.WheelchairCommand) -> Dict[str, Any]:  # noqa: D401
+        async def left_control(request: Request) -> Response:  # noqa: D401
             """Control the left wheelchair."""
+            cmd = await _read_command(request)
             try:
-                self.left_service.control(cmd.speed, cmd.direction)
-                return {
+                # control() blocks while the serial port reconnects: keep it off the event loop
+                await asyncio.wrap_future(self._drive_side("left", cmd.speed, cmd.direction))
+                # Returned as a response: no response model to validate the dict against
+                return ORJSONResponse({
                     "message": "Left wheelchair command received",
                     "speed": cmd.speed,
                     "direction": cmd.direction,
-                }
+                })
             except Exception as exc:
                 raise HTTPException(status_code=500, detail=str(exc)) from exc
 
         @app.post("/wheelchair/right/control")
-        async def right_control(cmd: models.WheelchairCommand) -> Dict[str, Any]:  # noqa: D401
+        async def right_control(request: Request) -> Response:  # noqa: D401
             """Control the right wheelchair."""
+            cmd = await _read_command(request)
             try:
-                self.right_service.control(cmd.speed, cmd.direction)
-                return {
+                # control() blocks while the serial port reconnects: keep it off the event loop
+                await asyncio.wrap_future(self._drive_side("right", cmd.speed, cmd.direction))
+                # Returned as a response: no response model to validate the dict against
+                return ORJSONResponse({
                     "message": "Right wheelchair command received",
                     "speed": cmd.speed,
                     "direction": cmd.direction,
-                }
+                })
             except Exception as exc:
                 raise HTTPException(status_code=500, detail=str(exc)) from exc
 
         @app.get("/wheelchair/left/status")
         async def left_status() -> Dict[str, Any]:  # noqa: D401
             """Get the status of the left wheelchair."""
-            return self.left_service.get_status()
+            return self._read_wheelchairs()[0]['status']
 
         @app.get("/wheelchair/right/status")
         async def right_status() -> Dict[str, Any]:  # noqa: D401
             """Get the status of the right wheelchair."""
-            return self.right_service.get_status()
+            return self._read_wheelchairs()[1]['status']
 
     def run(self, *, host: str, port: int) -> None:
-        """Run the server with Uvicorn."""
-        config = uvicorn.Config(self.app, host=host, port=port, timeout_graceful_shutdown=30)
+        """Run the server with Uvicorn on a uvloop event loop created up front."""
+        # Ask for uvloop and httptools explicitly so a broken install fails loudly instead of silently
+        # falling back to the pure-Python loop and parser.
+        # No access log: one synchronous stderr write per request, 50 of them per second from navigation.
+        config = uvicorn.Config(
+            self.app,
+            host=host,
+            port=port,
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+            log_level="warning",
+            lifespan="on",
+            timeout_graceful_shutdown=30,
+        )
         server = uvicorn.Server(config)
-        server.run()
+        # When the control thread wakes up while an HTTP handler holds the GIL, it waits up to one
+        # switch interval for it: keep that wait well below the 20 ms tick.
+        sys.setswitchinterval(GIL_SWITCH_INTERVAL)
+        # Drive serve() directly rather than Server.run(): the loop exists before any app code runs
+        loop = uvloop.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(server.serve())
+        finally:
+            loop.close()
 
 
 def run_server(
@@ -249,6 +580,8 @@ def run_server(
     right_serial_port: str,
     lights_serial_port: str,
     deadzone: float,
+    rt_priority: int = 0,
+    rt_cpu: int | None = None,
 ) -> None:
     """Convenience wrapper that instantiates :class:`ControllerServer` and calls :py:meth:`ControllerServer.run`."""
     server = ControllerServer(
@@ -256,5 +589,7 @@ def run_server(
         right_serial_port=right_serial_port,
         lights_serial_port=lights_serial_port,
         deadzone=deadzone,
+        rt_priority=rt_priority,
+        rt_cpu=rt_cpu,
     )
     server.run(host=host, port=port) 
\ No newline at end of file
@@ -3,23 +3,32 @@
 from __future__ import annotations
 
 import asyncio
-import datetime
+import logging
 import math
 from contextlib import asynccontextmanager
-import contextlib
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict
 
 import httpx
+import orjson
 import uvicorn
+import uvloop
 from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from libs import models
+from libs import logs, models, nav_math, pacing, realtime
 
+logger = logging.getLogger(__name__)
 
 STATIC_PATH = Path(__file__).resolve().parent.parent / "static"
+HTML_CACHE_HEADERS = {"Cache-Control": "max-age=300"}
+CONTROL_LOOP_PERIOD = 0.02  # seconds, 50 Hz
+_HALF_PI = math.pi * 0.5
+# A handful of kept-alive connections to the controller, never re-opened per command. A command
+# that cannot be sent within a few ticks is stale: fail fast and let the next tick send a fresh one.
+CONTROLLER_LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=4, keepalive_expiry=60)
+CONTROLLER_TIMEOUT = httpx.Timeout(0.5, connect=0.2)
 
 
 class NavigationServer:
@@ -32,6 +41,9 @@ class NavigationServer:
         controller_port: int,
         thermo_serial_port: str,
         gps_serial_port: str,
+        reverse_proxy: bool = False,
+        rt_priority: int = 0,
+        rt_cpu: int | None = None,
     ) -> None:
         """Instantiate the navigation server.
 
@@ -39,25 +51,42 @@ class NavigationServer:
         :param controller_port: Port of the controller server
         :param thermo_serial_port: Serial port for the temperature sensor
         :param gps_serial_port: Serial port for the GPS
+        :param reverse_proxy: Leave the pages and static assets to a reverse proxy (see ``Caddyfile``)
+        :param rt_priority: SCHED_FIFO priority of the control loop thread, 0 to keep the default scheduler
+        :param rt_cpu: CPU to pin the control loop thread to, None to let the kernel choose
         """
         self.controller_url = f"http://{controller_host}:{controller_port}"
+        # Unvalidated variant of /controller/control, meant for this 50 Hz stream
+        self._control_url = f"{self.controller_url}/controller/control_fast"
+        self._json_headers = {"content-type": "application/json"}
+        # Probed once the HTTP client exists, when the control loop starts
         self._controller_healthy: bool = False
-        # Check the controller health once during startup
-        try:
-            asyncio.run(self._check_controller_health())
-        except RuntimeError:
-            # If an event loop is already running, schedule the coroutine instead.
-            loop = asyncio.get_running_loop()
-            loop.create_task(self._check_controller_health())
 
         # State
+        self.geoposition: models.Geopoint | None = None
         self.target_geopoint: models.Geopoint | None = None
         self.theta: float = math.radians(45)
 
         self._client_controller: httpx.AsyncClient | None = None
-        self._task_loop: asyncio.Task[None] | None = None
-
-        self.app = FastAPI(title="Couch Navigation Server", version="1.0.0", lifespan=self._lifespan)
+        # The control loop logs from its real-time thread: only enqueue there, never write stderr
+        self._logging = logs.QueueLogging(logger)
+        self._control_thread = realtime.LoopThread(
+            self._control_loop,
+            name="navigation-control",
+            priority=rt_priority,
+            cpu=rt_cpu,
+            loop_factory=uvloop.new_event_loop,
+        )
+        self.reverse_proxy = reverse_proxy
+        self._map_html = str(STATIC_PATH / "map.html")
+        self._monitor_html = str(STATIC_PATH / "monitor.html")
+
+        self.app = FastAPI(
+            title="Couch Navigation Server",
+            version="1.0.0",
+            lifespan=self._lifespan,
+            default_response_class=ORJSONResponse,
+        )
         self._setup_routes()
 
     # ------------------------------------------------------------------
@@ -66,18 +95,14 @@ class NavigationServer:
 
     @asynccontextmanager
     async def _lifespan(self, _app: FastAPI) -> AsyncGenerator[None, Any]:
-        """Create the HTTP client and background control-loop."""
-        async with httpx.AsyncClient() as client:
-            self._client_controller = client
-            self._task_loop = asyncio.create_task(self._control_loop())
-            try:
-                yield
-            finally:
-                if self._task_loop:
-                    self._task_loop.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await self._task_loop
-                self._client_controller = None
+        """Start and stop the log drain and the background control-loop thread."""
+        self._logging.start()
+        self._control_thread.start()
+        try:
+            yield
+        finally:
+            self._control_thread.stop()
+            self._logging.stop()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -94,19 +119,6 @@ class NavigationServer:
         -------
         True if the controller responds with a JSON payload ``{"status": "healthy"}``, False otherwise.
         """
-        if self._client_controller is None:
-            # Create a temporary client for the one-off probe when the shared client
-            # has not been instantiated yet (e.g. during object construction).
-            async with httpx.AsyncClient() as client:
-                try:
-                    resp = await client.get(f"{self.controller_url}/health", timeout=2.0)
-                    healthy = resp.status_code == 200 and resp.json().get("status") == "healthy"
-                    self._controller_healthy = healthy
-                    return healthy
-                except Exception:
-                    self._controller_healthy = False
-                    return False
-
         try:
             resp = await self._client_controller.get(f"{self.controller_url}/health", timeout=2.0)
             healthy = resp.status_code == 200 and resp.json().get("status") == "healthy"
@@ -118,26 +130,15 @@ class NavigationServer:
 
     def compute_autonomous_command(self) -> tuple[float, float]:
         """Return speed and direction to reach :pyattr:`target_geopoint`."""
-        if self.target_geopoint is None or self.geoposition is None:
+        # Read each once: the routes may swap them from the HTTP thread meanwhile
+        position, target = self.geoposition, self.target_geopoint
+        if target is None or position is None:
             return 0.0, 0.0
-        lat1, lon1 = self.geoposition.lat, self.geoposition.lon
-        lat2, lon2 = self.target_geopoint.lat, self.target_geopoint.lon
-        R = 6_371_000.0
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        distance = R * c
+        bearing, distance = nav_math.bearing_and_distance(position.lat, position.lon, target.lat, target.lon)
         if distance < 3.0:
             return 0.0, 0.0
-        y = math.sin(math.radians(lon2 - lon1)) * math.cos(math.radians(lat2))
-        x = math.cos(math.radians(lat1)) * math.sin(math.radians(lat2)) - math.sin(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.cos(math.radians(lon2 - lon1))
-        bearing = math.atan2(y, x)
-        direction = bearing - self.theta
-        while direction > math.pi:
-            direction -= 2 * math.pi
-        while direction < -math.pi:
-            direction += 2 * math.pi
+        # Wrap to [-pi, pi]
+        direction = math.remainder(bearing - self.theta, math.tau)
         return 1.0, max(-1.0, min(1.0, direction))
 
     def _simulate_movement(self, speed: float, direction: float) -> None:
@@ -152,35 +153,46 @@ class NavigationServer:
             lat=self.geoposition.lat + speed * math.cos(self.theta),
             lon=self.geoposition.lon + speed * math.sin(self.theta),
         )
-        self.theta = max(-math.pi / 2, min(math.pi / 2, self.theta + direction / (1 + speed)))
+        self.theta = max(-_HALF_PI, min(_HALF_PI, self.theta + direction / (1 + speed)))
 
     async def _post_controller_command(self, speed: float, direction: float) -> None:
         """Send a command to the controller."""
         if self._client_controller is None:
             return
-        payload: Dict[str, Any] = {
-            "speed": speed,
-            "direction": direction,
-            "timestamp": datetime.datetime.utcnow().isoformat(),
-        }
-        await self._client_controller.post(f"{self.controller_url}/controller/control", json=payload, timeout=1.0)
+        # control_fast reads only these two fields
+        payload = {"speed": speed, "direction": direction}
+        # Encode to bytes in one go instead of letting httpx run it through the stdlib json module
+        await self._client_controller.post(self._control_url, content=orjson.dumps(payload), headers=self._json_headers)
 
     async def _control_loop(self) -> None:
         """Background loop computing and sending commands."""
-        while True:
+        # The limits go on the transport: httpx ignores the client's when a transport is given
+        transport = httpx.AsyncHTTPTransport(limits=CONTROLLER_LIMITS, retries=0)
+        # The client is bound to the event loop it is created on: create it on the control thread's
+        async with httpx.AsyncClient(transport=transport, timeout=CONTROLLER_TIMEOUT) as client:
+            self._client_controller = client
             try:
-                start = asyncio.get_running_loop().time()
-                speed, direction = self.compute_autonomous_command()
-                self._simulate_movement(speed, direction)
-                if speed != 0.0 or direction != 0.0:
-                    await self._post_controller_command(speed, direction)
-                elapsed = asyncio.get_running_loop().time() - start
-                await asyncio.sleep(max(0.0, 0.02 - elapsed)) # safety margin but it should run all the time
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:
-                print(f"Navigation control-loop error: {exc}")
-                await asyncio.sleep(0.02) # safety margin but it should run all the time
+                await self._check_controller_health()
+                ticker = pacing.DeadlineTicker(CONTROL_LOOP_PERIOD)
+                failures = 0
+                while True:
+                    try:
+                        speed, direction = self.compute_autonomous_command()
+                        self._simulate_movement(speed, direction)
+                        if speed != 0.0 or direction != 0.0:
+                            await self._post_controller_command(speed, direction)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as exc:
+                        failures += 1
+                        logger.warning("Navigation control-loop error (%d in a row): %s", failures, exc)
+                        await asyncio.sleep(pacing.backoff_delay(CONTROL_LOOP_PERIOD, failures))
+                        ticker.reset()
+                        continue
+                    failures = 0
+                    await ticker.wait()
+            finally:
+                self._client_controller = None
 
     # ------------------------------------------------------------------
     # Routes
@@ -189,24 +201,19 @@ class NavigationServer:
     def _setup_routes(self) -> None:
         app = self.app
 
-        # Static assets
-        app.mount("/static", StaticFiles(directory=STATIC_PATH), name="static")
-        app.mount("/js", StaticFiles(directory=STATIC_PATH / "js"), name="js")
-        app.mount("/burning_man_2023_geojson", StaticFiles(directory=STATIC_PATH / "burning_man_2023_geojson"), name="geojson")
-        app.mount("/tiles", StaticFiles(directory=STATIC_PATH / "tiles"), name="tiles")
-        app.mount("/icons", StaticFiles(directory=STATIC_PATH / "icons"), name="icons")
-
-        @app.get("/")
-        async def root() -> FileResponse:  # noqa: D401
-            return FileResponse(STATIC_PATH / "map.html")
+        if not self.reverse_proxy:
+            self._setup_static_routes()
 
         @app.get("/health")
         async def health() -> Dict[str, str]:  # noqa: D401
             return {"status": "healthy"}
 
-        @app.get("/position")
-        async def position() -> models.Geopoint | None:  # noqa: D401
-            return self.geoposition
+        # The geopoints are plain dicts by the time they reach the response: no response model
+        # validation round-trip through Pydantic on every poll.
+        @app.get("/position", response_model=None)
+        async def position() -> Dict[str, float] | None:  # noqa: D401
+            geoposition = self.geoposition
+            return geoposition.model_dump() if geoposition is not None else None
 
         @app.get("/theta")
         async def theta() -> float:  # noqa: D401
@@ -217,26 +224,52 @@ class NavigationServer:
             self.target_geopoint = target
             return {"message": "Target position received"}
 
-        @app.get("/target_position")
-        async def get_target_position() -> models.Geopoint | None:  # noqa: D401
-            return self.target_geopoint
+        @app.get("/target_position", response_model=None)
+        async def get_target_position() -> Dict[str, float] | None:  # noqa: D401
+            target = self.target_geopoint
+            return target.model_dump() if target is not None else None
 
         @app.delete("/target_position")
         async def clear_target_position() -> Dict[str, str]:  # noqa: D401
             self.target_geopoint = None
             return {"message": "Target position cleared"}
 
+    def _setup_static_routes(self) -> None:
+        """Serve the pages and static assets from Python, when no reverse proxy does it."""
+        app = self.app
+
+        # Static assets
+        app.mount("/static", StaticFiles(directory=STATIC_PATH), name="static")
+        app.mount("/js", StaticFiles(directory=STATIC_PATH / "js"), name="js")
+        app.mount("/burning_man_2023_geojson", StaticFiles(directory=STATIC_PATH / "burning_man_2023_geojson"), name="geojson")
+        app.mount("/tiles", StaticFiles(directory=STATIC_PATH / "tiles"), name="tiles")
+        app.mount("/icons", StaticFiles(directory=STATIC_PATH / "icons"), name="icons")
+
+        @app.get("/")
+        async def root() -> FileResponse:  # noqa: D401
+            return FileResponse(self._map_html, headers=HTML_CACHE_HEADERS)
+
         @app.get("/dashboard", summary="Live navigation dashboard")
         async def dashboard() -> FileResponse:  # noqa: D401
-            return FileResponse(STATIC_PATH / "monitor.html")
+            return FileResponse(self._monitor_html, headers=HTML_CACHE_HEADERS)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def run(self, *, host: str, port: int) -> None:
-        """Serve the application with Uvicorn."""
-        config = uvicorn.Config(self.app, host=host, port=port, timeout_graceful_shutdown=30)
+        """Serve the application with Uvicorn, configured as :meth:`ControllerServer.run` explains."""
+        config = uvicorn.Config(
+            self.app,
+            host=host,
+            port=port,
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+            log_level="warning",
+            lifespan="on",
+            timeout_graceful_shutdown=30,
+        )
         uvicorn.Server(config).run()
 
 
@@ -248,6 +281,9 @@ def run_server(
     controller_port: int,
     thermo_serial_port: str,
     gps_serial_port: str,
+    reverse_proxy: bool = False,
+    rt_priority: int = 0,
+    rt_cpu: int | None = None,
 ) -> None:
     """Convenience wrapper for :class:`NavigationServer`."""
     server = NavigationServer(
@@ -255,5 +291,8 @@ def run_server(
         controller_port=controller_port,
         thermo_serial_port=thermo_serial_port,
         gps_serial_port=gps_serial_port,
+        reverse_proxy=reverse_proxy,
+        rt_priority=rt_priority,
+        rt_cpu=rt_cpu,
     )
     server.run(host=host, port=port)
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""Tests for the controller server, with the wheelchair serial I/O replaced by recorders."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from servers import controller
+
+
+class RecordingWheelchair:
+    """Stand-in for ``shark.WheelchairController.control`` keeping the commands it was given."""
+
+    def __init__(self) -> None:
+        self.commands: list[tuple[float, float]] = []
+        # Cleared to keep a command in flight, like a port busy reconnecting
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def __call__(self, speed: float, direction: float) -> None:
+        self.commands.append((speed, direction))
+        assert self.gate.wait(timeout=5.0)
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> controller.ControllerServer:
+    server = controller.ControllerServer(
+        left_serial_port="/dev/null-left",
+        right_serial_port="/dev/null-right",
+        lights_serial_port="/dev/null-lights",
+        deadzone=0.1,
+    )
+    monkeypatch.setattr(server.left_service, "control", RecordingWheelchair())
+    monkeypatch.setattr(server.right_service, "control", RecordingWheelchair())
+    return server
+
+
+@pytest.fixture
+def client(server: controller.ControllerServer) -> TestClient:
+    # No lifespan: the routes under test never touch the remote or the serial ports
+    return TestClient(server.app)
+
+
+COMMAND = {"speed": 0.1, "direction": 0.0, "timestamp": "2024-01-01T00:00:00"}
+
+
+@pytest.mark.parametrize("path", ["/navigation/command", "/controller/control", "/wheelchair/left/control"])
+def test_command_routes_accept_a_valid_body(client: TestClient, path: str):
+    assert client.post(path, json=COMMAND).status_code == 200
+
+
+@pytest.mark.parametrize("path", ["/navigation/command", "/controller/control", "/wheelchair/left/control"])
+def test_invalid_command_fields_are_located_under_body(client: TestClient, path: str):
+    response = client.post(path, json={"speed": "x"})
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert [(error["type"], error["loc"]) for error in detail] == [
+        ("float_parsing", ["body", "speed"]),
+        ("missing", ["body", "timestamp"]),
+    ]
+    assert all("url" not in error for error in detail)
+
+
+def test_invalid_command_json_is_located_at_body(client: TestClient):
+    response = client.post("/navigation/command", content=b"not json")
+    assert response.status_code == 422
+    assert [(error["type"], error["loc"]) for error in response.json()["detail"]] == [("json_invalid", ["body"])]
+
+
+def _drive(server: controller.ControllerServer, left: tuple[float, float], right: tuple[float, float]) -> None:
+    """Run one control-loop submission and wait for both sides to be applied."""
+    for future in server._drive(*left, *right, skip_unchanged=True):
+        future.result(timeout=5.0)
+
+
+def test_drive_skips_each_unchanged_side(server: controller.ControllerServer):
+    _drive(server, (0.5, 0.1), (0.5, -0.1))
+    _drive(server, (0.5, 0.1), (0.5, -0.1))
+    # Below COMMAND_EPSILON on the left, a real change on the right
+    _drive(server, (0.5 + controller.COMMAND_EPSILON / 2, 0.1), (0.4, -0.1))
+    assert server.left_service.control.commands == [(0.5, 0.1)]
+    assert server.right_service.control.commands == [(0.5, -0.1), (0.4, -0.1)]
+
+
+def test_drive_resends_an_unchanged_side_after_the_heartbeat(server: controller.ControllerServer):
+    _drive(server, (0.5, 0.1), (0.5, -0.1))
+    speed, direction, stamp = server._left_sent
+    server._left_sent = (speed, direction, stamp - controller.COMMAND_HEARTBEAT)
+    _drive(server, (0.5, 0.1), (0.5, -0.1))
+    assert server.left_service.control.commands == [(0.5, 0.1), (0.5, 0.1)]
+    assert server.right_service.control.commands == [(0.5, -0.1)]
+
+
+def test_drive_retries_a_command_dropped_behind_a_busy_side(server: controller.ControllerServer):
+    left = server.left_service.control
+    left.gate.clear()
+    first, _ = server._drive(0.5, 0.1, 0.0, 0.0, skip_unchanged=True)
+    # The left side is still busy: this command is dropped and not recorded as sent
+    dropped, _ = server._drive(0.2, 0.0, 0.0, 0.0, skip_unchanged=True)
+    assert dropped is first
+    assert server._left_sent[:2] == (0.5, 0.1)
+    left.gate.set()
+    first.result(timeout=5.0)
+    _drive(server, (0.2, 0.0), (0.0, 0.0))
+    assert left.commands == [(0.5, 0.1), (0.2, 0.0)]
+
+
+def test_drive_side_is_recorded_as_the_last_sent_command(server: controller.ControllerServer):
+    _drive(server, (0.0, 0.0), (0.0, 0.0))
+    server._drive_side("left", 0.5, 0.1).result(timeout=5.0)
+    assert server._left_sent[:2] == (0.5, 0.1)
+    # The control loop skips a command equal to the manual one, and replaces it as soon as it differs
+    _drive(server, (0.5, 0.1), (0.0, 0.0))
+    _drive(server, (0.0, 0.0), (0.0, 0.0))
+    assert server.left_service.control.commands == [(0.0, 0.0), (0.5, 0.1), (0.0, 0.0)]
+    assert server.right_service.control.commands == [(0.0, 0.0)]
+
+
+def test_wheelchair_route_goes_through_drive_side(client: TestClient, server: controller.ControllerServer):
+    assert client.post("/wheelchair/right/control", json={**COMMAND, "speed": 0.3}).status_code == 200
+    assert server.right_service.control.commands == [(0.3, 0.0)]
+    assert server._right_sent[:2] == (0.3, 0.0)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"speed": 0.1}',
+        b'{"speed": "fast", "direction": 0}',
+        b'{"speed": null, "direction": 0}',
+        b'[0.1, 0]',
+        b'not json',
+        b'{"speed": "nan", "direction": 0}',
+        b'{"speed": 0, "direction": "inf"}',
+        b'{"speed": "1e999", "direction": 0}',
+    ],
+)
+def test_control_fast_rejects_invalid_commands(client: TestClient, server: controller.ControllerServer, body: bytes):
+    assert client.post("/controller/control_fast", content=body).status_code == 422
+    assert server._left_pending is None and server._right_pending is None
+
+
+def test_control_fast_drives_both_sides(client: TestClient, server: controller.ControllerServer):
+    response = client.post("/controller/control_fast", content=b'{"speed": 0.5, "direction": 0}')
+    assert response.status_code == 200
+    for future in (server._left_pending, server._right_pending):
+        future.result(timeout=5.0)
+    assert server.left_service.control.commands == [pytest.approx((0.5, 0.0))]
+    assert server.right_service.control.commands == [pytest.approx((0.5, 0.0))]
+
+
+@pytest.mark.parametrize("path", ["/navigation/command", "/controller/control", "/wheelchair/left/control"])
+def test_command_routes_reject_non_finite_values(client: TestClient, path: str):
+    response = client.post(path, json={**COMMAND, "speed": "nan"})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "speed"]
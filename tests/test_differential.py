@@ -0,0 +1,58 @@
+"""Tests for the differential drive, against the formula it replaced."""
+
+import math
+import random
+
+from libs import differential
+
+
+def _reference_states(drive: differential.DifferentialDrive, speed: float, direction: float) -> tuple[float, float, float, float]:
+    """calculate_wheelchair_states as it first was, flattened in the order it returned the commands."""
+    right_speed = speed + direction / 2
+    left_speed = speed - direction / 2
+    max_speed = max(abs(right_speed), abs(left_speed))
+    if max_speed > drive.max_speed:
+        right_speed = right_speed * drive.max_speed / max_speed
+        left_speed = left_speed * drive.max_speed / max_speed
+    ICR_radius = (drive.distance_between_wheelchairs / 2) * differential._zero_safe_division(right_speed + left_speed, right_speed - left_speed)
+    right_direction = right_speed / (ICR_radius + drive.distance_between_wheelchairs / 2 * differential._sign(direction))
+    left_direction = left_speed / (ICR_radius - drive.distance_between_wheelchairs / 2 * differential._sign(direction))
+    max_direction = max(abs(right_direction), abs(left_direction))
+    if max_direction > drive.max_direction:
+        right_direction = right_direction * drive.max_direction / max_direction
+        left_direction = left_direction * drive.max_direction / max_direction
+    # The first command has always been sent to the left wheelchair
+    return right_speed, right_direction, left_speed, left_direction
+
+
+def _random_input(rng: random.Random) -> tuple[float, float]:
+    # Include the exact zeros the idle joystick and the pivots produce
+    speed = rng.choice([0.0, rng.uniform(-1.5, 1.5)])
+    direction = rng.choice([0.0, rng.uniform(-1.5, 1.5)])
+    return speed, direction
+
+
+def test_calculate_raw_matches_reference():
+    drive = differential.DifferentialDrive()
+    rng = random.Random(0)
+    for _ in range(20_000):
+        speed, direction = _random_input(rng)
+        assert drive.calculate_raw(speed, direction) == _reference_states(drive, speed, direction)
+
+
+def test_calculate_wheelchair_states_matches_calculate_raw():
+    drive = differential.DifferentialDrive()
+    rng = random.Random(1)
+    for _ in range(1_000):
+        speed, direction = _random_input(rng)
+        left, right = drive.calculate_wheelchair_states(speed, direction)
+        assert (left.speed, left.direction, right.speed, right.direction) == drive.calculate_raw(speed, direction)
+
+
+def test_calculate_raw_limits():
+    drive = differential.DifferentialDrive()
+    left_speed, left_direction, right_speed, right_direction = drive.calculate_raw(2.0, 1.0)
+    assert max(abs(left_speed), abs(right_speed)) <= drive.max_speed
+    assert max(abs(left_direction), abs(right_direction)) <= drive.max_direction + 1e-12
+    assert drive.calculate_raw(0.0, 0.0) == (0.0, 0.0, 0.0, 0.0)
+    assert all(math.isfinite(value) for value in drive.calculate_raw(0.0, 0.5))
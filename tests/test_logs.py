@@ -0,0 +1,46 @@
+"""Tests for the logging helpers."""
+
+import logging
+
+import pytest
+
+from libs import logs
+
+
+def _record(msg: str, *args: object, level: int = logging.WARNING, name: str = "couch") -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(logs.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_throttle_drops_repeats_within_the_interval(clock: list[float]):
+    throttle = logs.ThrottleFilter(interval=5.0)
+    assert throttle.filter(_record("tick failed (%d in a row)", 1))
+    clock[0] += 1.0
+    # Same template, different arguments
+    assert not throttle.filter(_record("tick failed (%d in a row)", 2))
+    clock[0] += 4.0
+    assert throttle.filter(_record("tick failed (%d in a row)", 3))
+
+
+def test_throttle_keeps_distinct_messages(clock: list[float]):
+    throttle = logs.ThrottleFilter(interval=5.0)
+    assert throttle.filter(_record("tick failed"))
+    assert throttle.filter(_record("loop overran"))
+    assert throttle.filter(_record("tick failed", level=logging.ERROR))
+    assert throttle.filter(_record("tick failed", name="other"))
+    assert not throttle.filter(_record("tick failed"))
+
+
+def test_throttle_forgets_once_full(clock: list[float]):
+    throttle = logs.ThrottleFilter(interval=5.0)
+    for index in range(logs.MAX_TRACKED_MESSAGES):
+        assert throttle.filter(_record(f"message {index}"))
+    assert throttle.filter(_record("one too many"))
+    # The table was cleared to make room: earlier messages pass again
+    assert throttle.filter(_record("message 0"))
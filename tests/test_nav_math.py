@@ -0,0 +1,89 @@
+"""Tests for the navigation maths, against the formulas they replaced."""
+
+import math
+import random
+
+from libs import models, nav_math
+from servers import navigation
+
+CASES = 20_000
+
+
+def _reference_bearing_and_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> tuple[float, float]:
+    """Haversine distance and initial bearing, written as compute_autonomous_command first had them."""
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+    distance = 6_371_000.0 * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    y = math.sin(math.radians(lon2 - lon1)) * math.cos(math.radians(lat2))
+    x = math.cos(math.radians(lat1)) * math.sin(math.radians(lat2)) - math.sin(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.cos(math.radians(lon2 - lon1))
+    return math.atan2(y, x), distance
+
+
+def _reference_command(lat1: float, lon1: float, lat2: float, lon2: float, theta: float) -> tuple[float, float]:
+    """compute_autonomous_command as it first was, heading wrapped with while loops."""
+    bearing, distance = _reference_bearing_and_distance(lat1, lon1, lat2, lon2)
+    if distance < 3.0:
+        return 0.0, 0.0
+    direction = bearing - theta
+    while direction > math.pi:
+        direction -= 2 * math.pi
+    while direction < -math.pi:
+        direction += 2 * math.pi
+    return 1.0, max(-1.0, min(1.0, direction))
+
+
+def _random_point(rng: random.Random) -> tuple[float, float]:
+    # Mostly nearby points, as the couch sees them, with some far away ones
+    if rng.random() < 0.8:
+        return 40.78 + rng.uniform(-0.01, 0.01), -119.2 + rng.uniform(-0.01, 0.01)
+    return rng.uniform(-89.0, 89.0), rng.uniform(-180.0, 180.0)
+
+
+def test_bearing_and_distance_matches_reference():
+    rng = random.Random(0)
+    for _ in range(CASES):
+        lat1, lon1 = _random_point(rng)
+        lat2, lon2 = _random_point(rng)
+        bearing, distance = nav_math.bearing_and_distance(lat1, lon1, lat2, lon2)
+        ref_bearing, ref_distance = _reference_bearing_and_distance(lat1, lon1, lat2, lon2)
+        assert math.isclose(bearing, ref_bearing, rel_tol=1e-12, abs_tol=1e-12)
+        assert math.isclose(distance, ref_distance, rel_tol=1e-10, abs_tol=1e-9)
+
+
+def test_bearing_and_distance_known_values():
+    bearing, distance = nav_math.bearing_and_distance(0.0, 0.0, 1.0, 0.0)
+    assert bearing == 0.0
+    assert math.isclose(distance, nav_math.EARTH_RADIUS * math.radians(1.0))
+    bearing, _ = nav_math.bearing_and_distance(0.0, 0.0, 0.0, 1.0)
+    assert math.isclose(bearing, math.pi / 2)
+
+
+def test_compute_autonomous_command_matches_reference():
+    server = navigation.NavigationServer(
+        controller_host="127.0.0.1", controller_port=8000, thermo_serial_port="", gps_serial_port=""
+    )
+    rng = random.Random(1)
+    for _ in range(CASES):
+        lat1, lon1 = _random_point(rng)
+        lat2, lon2 = _random_point(rng)
+        theta = rng.uniform(-math.pi, math.pi)
+        server.geoposition = models.Geopoint(lat=lat1, lon=lon1)
+        server.target_geopoint = models.Geopoint(lat=lat2, lon=lon2)
+        server.theta = theta
+        speed, direction = server.compute_autonomous_command()
+        ref_speed, ref_direction = _reference_command(lat1, lon1, lat2, lon2, theta)
+        assert speed == ref_speed
+        assert math.isclose(direction, ref_direction, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_compute_autonomous_command_idle_without_target():
+    server = navigation.NavigationServer(
+        controller_host="127.0.0.1", controller_port=8000, thermo_serial_port="", gps_serial_port=""
+    )
+    assert server.compute_autonomous_command() == (0.0, 0.0)
+    server.target_geopoint = models.Geopoint(lat=40.78, lon=-119.2)
+    assert server.compute_autonomous_command() == (0.0, 0.0)
+    # Within the 3 m arrival radius
+    server.geoposition = models.Geopoint(lat=40.78, lon=-119.2)
+    assert server.compute_autonomous_command() == (0.0, 0.0)
@@ -0,0 +1,79 @@
+"""Tests for the control-loop pacing."""
+
+import asyncio
+import time
+
+import pytest
+
+from libs import pacing
+
+PERIOD = 0.01
+
+
+def test_backoff_delay_doubles_up_to_the_cap():
+    delays = [pacing.backoff_delay(0.02, failures) for failures in range(1, 9)]
+    assert delays[:5] == pytest.approx([0.02, 0.04, 0.08, 0.16, 0.32])
+    assert delays[5:] == [pacing.BACKOFF_MAX] * 3
+
+
+def test_backoff_delay_stays_bounded_for_many_failures():
+    assert pacing.backoff_delay(0.02, 10_000) == pacing.BACKOFF_MAX
+
+
+def test_ticker_keeps_the_period():
+    async def run() -> float:
+        ticker = pacing.DeadlineTicker(PERIOD)
+        assert not await ticker.wait()
+        start = time.monotonic()
+        for _ in range(10):
+            assert not await ticker.wait()
+        assert ticker.dropped == 0
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) == pytest.approx(10 * PERIOD, abs=PERIOD)
+
+
+def test_ticker_drops_ticks_after_an_overrun():
+    async def run() -> None:
+        ticker = pacing.DeadlineTicker(PERIOD)
+        await ticker.wait()
+        # Work for several periods: more than a whole tick late
+        time.sleep(5 * PERIOD)
+        start = time.monotonic()
+        assert await ticker.wait()
+        # The missed ticks are dropped, not run back-to-back
+        assert time.monotonic() - start < PERIOD
+        assert ticker.dropped == 1
+        start = time.monotonic()
+        assert not await ticker.wait()
+        assert time.monotonic() - start == pytest.approx(PERIOD, abs=PERIOD / 2)
+
+    asyncio.run(run())
+
+
+def test_ticker_late_by_less_than_a_period_catches_up():
+    async def run() -> None:
+        ticker = pacing.DeadlineTicker(PERIOD)
+        await ticker.wait()
+        time.sleep(1.5 * PERIOD)
+        start = time.monotonic()
+        assert not await ticker.wait()
+        # The next deadline is kept on the original schedule
+        assert time.monotonic() - start < PERIOD
+        assert ticker.dropped == 0
+
+    asyncio.run(run())
+
+
+def test_ticker_reset_restarts_the_schedule():
+    async def run() -> None:
+        ticker = pacing.DeadlineTicker(PERIOD)
+        await ticker.wait()
+        await asyncio.sleep(5 * PERIOD)
+        ticker.reset()
+        start = time.monotonic()
+        assert not await ticker.wait()
+        assert time.monotonic() - start == pytest.approx(PERIOD, abs=PERIOD / 2)
+        assert ticker.dropped == 0
+
+    asyncio.run(run())
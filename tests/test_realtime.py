@@ -0,0 +1,42 @@
+"""Tests for the real-time loop thread."""
+
+import asyncio
+
+import pytest
+
+from libs import realtime
+
+
+def test_start_runs_the_target_and_stop_cancels_it():
+    async def target() -> None:
+        await asyncio.sleep(60)
+
+    thread = realtime.LoopThread(target, name="test-loop")
+    thread.start()
+    thread.stop(timeout=5.0)
+    assert not thread._thread.is_alive()
+
+
+def test_start_reraises_a_setup_error():
+    def broken_factory() -> asyncio.AbstractEventLoop:
+        raise RuntimeError("no loop for you")
+
+    async def target() -> None:
+        pass
+
+    thread = realtime.LoopThread(target, name="test-loop", loop_factory=broken_factory)
+    with pytest.raises(RuntimeError, match="no loop for you"):
+        thread.start()
+
+
+def test_start_survives_an_invalid_cpu(capsys: pytest.CaptureFixture[str]):
+    ran = []
+
+    async def target() -> None:
+        ran.append(True)
+
+    thread = realtime.LoopThread(target, name="test-loop", cpu=-1)
+    thread.start()
+    thread._thread.join(timeout=5.0)
+    assert ran == [True]
+    assert "Unable to pin thread to CPU -1" in capsys.readouterr().out